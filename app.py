@@ -1,14 +1,13 @@
-def inject_custom_css():
-    # --- VISUAL ENGINE (CSS) ---
-    st.markdown("""
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Rajdhani:wght@300;500;700&display=swap');
+import re
 
+import streamlit as st
+
+# --- VISUAL ENGINE (CSS) ---
+_CSS_BLOB = """
+    <style>
         /* --- 1. BACKGROUND FIX (GRADIENT THEME) --- */
         [data-testid="stAppViewContainer"] {
             background: linear-gradient(135deg, #0a0a0e 0%, #061D42 60%, #004e92 100%) !important;
-            background-size: cover;
-            background-attachment: fixed;
         }
         .stApp {
             background: transparent !important;
@@ -24,8 +23,7 @@ def inject_custom_css():
 
         /* --- 3. SIDEBAR --- */
         section[data-testid="stSidebar"] {
-            background: rgba(0, 0, 0, 0.6) !important; 
-            backdrop-filter: blur(15px); 
+            background: rgba(10, 10, 18, 0.88) !important;
             border-right: 1px solid rgba(255, 255, 255, 0.1);
         }
 
@@ -40,7 +38,7 @@ def inject_custom_css():
             padding: 12px 15px !important;
             margin-bottom: 8px !important;
             border-radius: 0px 10px 10px 0px; 
-            transition: all 0.3s ease;
+            transition: background-color 0.3s ease, border-color 0.3s ease, color 0.3s ease;
             font-family: 'Orbitron', sans-serif;
             font-size: 0.9rem;
             cursor: pointer;
@@ -50,7 +48,6 @@ def inject_custom_css():
         div[role="radiogroup"] label:hover {
             background: rgba(255, 255, 255, 0.15);
             border-left: 3px solid #00F0FF; 
-            transform: translateX(5px);
             color: white;
         }
         div[role="radiogroup"] label[data-checked="true"] {
@@ -75,8 +72,7 @@ def inject_custom_css():
             text-shadow: 0 0 10px rgba(0, 240, 255, 0.5);
         }
         .glass-card {
-            background: rgba(20, 20, 25, 0.6);
-            backdrop-filter: blur(12px);
+            background: rgba(20, 20, 25, 0.9);
             border: 1px solid rgba(255, 255, 255, 0.1);
             box-shadow: 0 4px 30px rgba(0, 0, 0, 0.5);
             padding: 20px;
@@ -91,12 +87,11 @@ def inject_custom_css():
             border: 1px solid #FF1801 !important;
             color: white !important;
             font-family: 'Orbitron', sans-serif !important;
-            transition: all 0.3s ease !important;
+            transition: background-color 0.3s ease !important;
         }
         button[kind="primary"]:hover {
             background-color: #D00000 !important;
             box-shadow: 0 0 15px rgba(255, 24, 1, 0.6) !important;
-            transform: scale(1.02);
         }
         
         /* Secondary (Initialize AI) - Outline Red */
@@ -139,4 +134,14 @@ def inject_custom_css():
         }
 
     </style>
-    """, unsafe_allow_html=True)
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Rajdhani:wght@300;500;700&display=swap">
+"""
+# Minify once at import: the blob is re-sent to the browser on every rerun.
+_CSS_BLOB = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", _CSS_BLOB, flags=re.S)).strip()
+
+
+def inject_custom_css():
+    # Streamlit drops elements a rerun does not re-emit, so this must still run every rerun.
+    st.markdown(_CSS_BLOB, unsafe_allow_html=True)
@@ -1,3 +1,4 @@
+import functools
 import json
 from groq import Groq
 import os
@@ -6,6 +7,9 @@ from groq import Groq
 
 load_dotenv()  # loads .env file
 
+# Answers are memoized per input, so repeat questions skip the Groq round-trip.
+LLM_CACHE_SIZE = 256
+
 client = Groq(
     api_key=os.getenv("GROQ_API_KEY")
 )
@@ -18,22 +22,36 @@ with open("driver_knowledge.json", "r") as f:
     DRIVER_KNOWLEDGE = json.load(f)
 
 
+# -----------------------------
+# 2. Surname index
+# -----------------------------
+def _index_by_surname(records):
+    # Surnames are shared across generations (Schumacher, Verstappen, Hill),
+    # so each key maps to the positions of every matching record.
+    index = {}
+    for position, d in enumerate(records):
+        index.setdefault(d["surname"].lower(), []).append(position)
+    return index
+
+
+DRIVER_ROWS_BY_SURNAME = _index_by_surname(DRIVER_KNOWLEDGE)
+
 
 # -----------------------------
 # 3. Context helpers
 # -----------------------------
 def get_driver_context(driver_name):
     return [
-        d for d in DRIVER_KNOWLEDGE
-        if d["surname"].lower() == driver_name.lower()
+        DRIVER_KNOWLEDGE[i]
+        for i in DRIVER_ROWS_BY_SURNAME.get(driver_name.lower(), [])
     ]
 
 
 def get_comparison_context(driver_a, driver_b):
-    return [
-        d for d in DRIVER_KNOWLEDGE
-        if d["surname"].lower() in [driver_a.lower(), driver_b.lower()]
-    ]
+    # Merge both drivers' rows back into file order, as the full scan did.
+    rows = set(DRIVER_ROWS_BY_SURNAME.get(driver_a.lower(), []))
+    rows.update(DRIVER_ROWS_BY_SURNAME.get(driver_b.lower(), []))
+    return [DRIVER_KNOWLEDGE[i] for i in sorted(rows)]
 
 
 # -----------------------------
@@ -58,14 +76,22 @@ not like they are reading a technical report.
 """
 
 
+def _stream_text(response):
+    """Yields the text deltas of a streamed chat completion."""
+    for chunk in response:
+        delta = chunk.choices[0].delta.content
+        if delta:
+            yield delta
+
+
 # -----------------------------
 # 5. Single-driver explanation
 # -----------------------------
-def explain_driver(driver_name, question):
+def _driver_request(driver_name, question):
     context = get_driver_context(driver_name)
 
     if not context:
-        return "Insufficient data to answer based on available statistics."
+        return None
 
     prompt = f"""
 {SYSTEM_PROMPT}
@@ -79,7 +105,7 @@ Question:
 Answer:
 """
 
-    response = client.chat.completions.create(
+    return dict(
         model="llama-3.1-8b-instant",
         messages=[
             {"role": "system", "content": SYSTEM_PROMPT},
@@ -89,17 +115,38 @@ Answer:
         max_tokens=900
     )
 
+
+@functools.lru_cache(maxsize=LLM_CACHE_SIZE)
+def explain_driver(driver_name, question):
+    request = _driver_request(driver_name, question)
+
+    if request is None:
+        return "Insufficient data to answer based on available statistics."
+
+    response = client.chat.completions.create(**request)
+
     return response.choices[0].message.content
 
 
+def explain_driver_stream(driver_name, question):
+    """Streaming explain_driver: yields text as it arrives, for st.write_stream."""
+    request = _driver_request(driver_name, question)
+
+    if request is None:
+        yield "Insufficient data to answer based on available statistics."
+        return
+
+    yield from _stream_text(client.chat.completions.create(stream=True, **request))
+
+
 # -----------------------------
 # 6. Driver comparison
 # -----------------------------
-def compare_drivers(driver_a, driver_b):
+def _comparison_request(driver_a, driver_b):
     context = get_comparison_context(driver_a, driver_b)
 
     if len(context) < 2:
-        return "Insufficient data to compare the selected drivers."
+        return None
 
     prompt = f"""
 {SYSTEM_PROMPT}
@@ -118,7 +165,7 @@ Compare {driver_a} and {driver_b} based on:
 Answer:
 """
 
-    response = client.chat.completions.create(
+    return dict(
         model="llama-3.1-8b-instant",
         messages=[
             {"role": "system", "content": SYSTEM_PROMPT},
@@ -128,24 +175,54 @@ Answer:
         max_tokens=800
     )
 
+
+@functools.lru_cache(maxsize=LLM_CACHE_SIZE)
+def compare_drivers(driver_a, driver_b):
+    request = _comparison_request(driver_a, driver_b)
+
+    if request is None:
+        return "Insufficient data to compare the selected drivers."
+
+    response = client.chat.completions.create(**request)
+
     return response.choices[0].message.content
 
 
+def compare_drivers_stream(driver_a, driver_b):
+    """Streaming compare_drivers: yields text as it arrives, for st.write_stream."""
+    request = _comparison_request(driver_a, driver_b)
+
+    if request is None:
+        yield "Insufficient data to compare the selected drivers."
+        return
+
+    yield from _stream_text(client.chat.completions.create(stream=True, **request))
+
+
 # 7. Similarity Explanation (NEW)
 # -----------------------------
 def explain_similarity_multi(target_driver, matches):
     """
     Explains the connection between the target and the 3 matches found by vectors.
     """
-    match_names = [m['surname'] for m in matches]
+    match_names = tuple(m['surname'] for m in matches)
 
+    try:
+        return _explain_similarity(target_driver, match_names)
+    except Exception as e:
+        return f"AI Connection Error: {e}"
+
+
+@functools.lru_cache(maxsize=LLM_CACHE_SIZE)
+def _explain_similarity(target_driver, match_names):
+    # Raises on API errors so failures are never cached.
     prompt = f"""
     {SYSTEM_PROMPT}
 
     Context:
     We performed a Vector Cosine Similarity search on '{target_driver}'.
     The algorithm identified these 3 drivers as the closest statistical matches:
-    {match_names}
+    {list(match_names)}
 
     Task:
     Write a short segment (as a commentator) explaining the common thread between these drivers.
@@ -157,16 +234,13 @@ def explain_similarity_multi(target_driver, matches):
     - NO "(Music)" or stage directions.
     """
 
-    try:
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=700
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"AI Connection Error: {e}"
+    response = client.chat.completions.create(
+        model="llama-3.1-8b-instant",
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.7,
+        max_tokens=700
+    )
+    return response.choices[0].message.content
 
 
 def narrate_race_story(stats):
@@ -195,16 +269,22 @@ def narrate_race_story(stats):
     """
 
     try:
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=700
-        )
-        return response.choices[0].message.content
+        return _narrate(prompt)
     except Exception as e:
         return f"AI Connection Error: {e}"
 
+
+@functools.lru_cache(maxsize=LLM_CACHE_SIZE)
+def _narrate(prompt):
+    # Keyed on the full prompt, so any change to the fact sheet is a new entry.
+    # Raises on API errors so failures are never cached.
+    response = client.chat.completions.create(
+        model="llama-3.1-8b-instant",
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.7,
+        max_tokens=700
+    )
+    return response.choices[0].message.content